@@ -756,16 +756,16 @@ class Welcome(commands.Cog):
                 ephemeral=True
             )
 
-async def setup(bot: commands.Bot, config=None):
+async def setup(bot: commands.Bot):
     """
     Setup function to register the cog with the bot.
     
     Args:
-        bot: The Discord bot instance
-        config: Optional configuration object
+        bot: The Discord bot instance; its optional ``app_config`` is passed to the cog
     """
     try:
-        cog = Welcome(bot, config)
+        # The constructor reads server_config.json, so keep that disk I/O off the event loop
+        cog = await asyncio.to_thread(Welcome, bot, getattr(bot, "app_config", None))
         await bot.add_cog(cog)
         logger.info("Welcome Cog loaded!")
         
@@ -777,4 +777,5 @@ async def setup(bot: commands.Bot, config=None):
         return cog
     except Exception as e:
         logger.error(f"Error setting up Welcome cog: {e}", exc_info=True)
-        return None
\ No newline at end of file
+        # Re-raise so the extension loader reports the failure
+        raise
\ No newline at end of file
@@ -1,39 +1,94 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import traceback
-import json
+import orjson
 import os
-from typing import List
+from typing import List, Optional, Tuple
 
 class ServerCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.server_links_file = 'server_links.json'
         self.server_links = self.load_server_links()
+        self.save_delay = 1.0  # Seconds to coalesce writes over
+        self._dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        self._autocomplete_index: List[Tuple[str, str, app_commands.Choice[str]]] = []
+        self._available_servers = ""
+        self._rebuild_index()
 
     def load_server_links(self) -> dict:
         """Load server links from a JSON file."""
         if os.path.exists(self.server_links_file):
-            with open(self.server_links_file, 'r') as f:
-                return json.load(f)
+            with open(self.server_links_file, 'rb') as f:
+                return orjson.loads(f.read())
         return {}
 
     def save_server_links(self):
-        """Save server links to a JSON file."""
-        with open(self.server_links_file, 'w') as f:
-            json.dump(self.server_links, f, indent=4)
+        """Schedule a debounced save of the server links."""
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._flush_server_links())
+
+    async def _flush_server_links(self):
+        """Wait for writes to settle, then persist the links off the event loop."""
+        try:
+            await asyncio.sleep(self.save_delay)
+            loop = asyncio.get_running_loop()
+            while self._dirty:
+                self._dirty = False
+                data = orjson.dumps(self.server_links, option=orjson.OPT_INDENT_2)
+                await loop.run_in_executor(None, self._write_server_links, data)
+        except Exception as e:
+            # Keep the change pending so the next save or the unload flush retries it
+            self._dirty = True
+            print(f"An error occurred while saving server links: {e}")
+            traceback.print_exc()
+
+    def _write_server_links(self, data: bytes):
+        """Atomically replace the server links file so readers never see a partial write."""
+        tmp_file = f"{self.server_links_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, self.server_links_file)
+
+    async def cog_unload(self):
+        """Flush any pending save before the cog goes away."""
+        if self._save_task is not None and not self._save_task.done():
+            # Let the pending flush finish rather than cancelling it: cancelling doesn't stop an
+            # executor write already in progress, which would then race the write below
+            await self._save_task
+        if self._dirty:
+            self._dirty = False
+            self._write_server_links(orjson.dumps(self.server_links, option=orjson.OPT_INDENT_2))
+
+    def _rebuild_index(self):
+        """Precompute the autocomplete index and the 'available servers' listing."""
+        self._autocomplete_index = [
+            (
+                server_key.lower(),
+                server_data["display_name"].lower(),
+                app_commands.Choice(name=server_data["display_name"], value=server_key),
+            )
+            for server_key, server_data in self.server_links.items()
+        ]
+        self._available_servers = ", ".join(
+            f"`{server}`" for server in sorted(self.server_links, key=str.lower)
+        )
 
     async def server_name_autocomplete(
             self,
             interaction: discord.Interaction,
             current: str,
     ) -> List[app_commands.Choice[str]]:
+        current = current.lower()
         return [
-            app_commands.Choice(name=server_data["display_name"], value=server_key)
-            for server_key, server_data in self.server_links.items()
-            if current.lower() in server_key.lower() or current.lower() in server_data["display_name"].lower()
-        ]
+            choice
+            for key_lower, display_lower, choice in self._autocomplete_index
+            if current in key_lower or current in display_lower
+        ][:25]  # Discord rejects more than 25 choices
 
     @app_commands.command(name="server", description="Get the link to a specific server.")
     @app_commands.describe(server_name="The name of the server.")
@@ -48,11 +103,8 @@ class ServerCog(commands.Cog):
 
             await interaction.response.send_message(f"This is the link to the {display_name}: {link}")
         else:
-            available_servers = ", ".join(
-                [f"`{server}`" for server in self.server_links]
-            )
             await interaction.response.send_message(
-                f"Sorry, I couldn't find a server named '{server_name}'.  Available servers: {available_servers}",
+                f"Sorry, I couldn't find a server named '{server_name}'.  Available servers: {self._available_servers}",
                 ephemeral=True,
             )
 
@@ -77,6 +129,7 @@ class ServerCog(commands.Cog):
 
         self.server_links[server_name] = {"display_name": server_name, "link": link}
         self.save_server_links()
+        self._rebuild_index()
         await interaction.response.send_message(f"Server '{server_name}' added successfully with link: {link}")
 
     @add_server.error
@@ -88,4 +141,5 @@ class ServerCog(commands.Cog):
         )
 
 async def setup(bot):
-    await bot.add_cog(ServerCog(bot))
\ No newline at end of file
+    # Construct off the event loop since loading server_links.json is blocking file I/O
+    await bot.add_cog(await asyncio.to_thread(ServerCog, bot))
\ No newline at end of file
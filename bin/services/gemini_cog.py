@@ -1,13 +1,13 @@
 import os
+import asyncio
+import aiohttp
 import discord
 from discord.ext import commands
-import google.generativeai as genai
-import requests
 import base64
 import random
 import traceback
 import logging
-from typing import List
+from typing import List, Optional
 import filetype
 import datetime
 
@@ -23,10 +23,18 @@ class GeminiCog(commands.Cog):
         self.GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
         if not self.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY environment variable not set.")
-        genai.configure(api_key=self.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self._model = None
         print("Gemini Cog Initialized")
 
+    @property
+    def model(self):
+        """Gemini model, imported and configured on first use to keep startup light."""
+        if self._model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=self.GEMINI_API_KEY)
+            self._model = genai.GenerativeModel('gemini-2.0-flash')
+        return self._model
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.author == self.bot.user:
@@ -117,7 +125,13 @@ class GeminiCog(commands.Cog):
                     'timestamp': msg['timestamp']
                 })
 
-            response = await get_response(user_input, self.model, image_url=image_url, history=history_for_prompt)
+            response = await get_response(
+                user_input,
+                self.model,
+                image_url=image_url,
+                history=history_for_prompt,
+                session=getattr(self.bot, "http_session", None)
+            )
 
             if response:
                 # --- Mention Handling (Corrected for DMs) ---
@@ -145,7 +159,7 @@ class GeminiCog(commands.Cog):
             traceback.print_exc()
             await message.channel.send("Oops! Something went wrong...")
 
-async def get_response(user_input: str, model, image_url=None, history=None) -> str:
+async def get_response(user_input: str, model, image_url=None, history=None, session: Optional[aiohttp.ClientSession] = None) -> str:
     """Gets AI response."""
     logger.info("Entering get_response function")
     lowered: str = user_input.lower()
@@ -183,10 +197,19 @@ async def get_response(user_input: str, model, image_url=None, history=None) ->
             full_prompt_content += f"\n\nThere is an image attached to this message. Please analyze the image and incorporate your analysis into your response."
             logger.info(f"Image instruction added to prompt: {full_prompt_content}")
 
-        return await generate_gemini_response(full_prompt_content, model, image_url)
+        return await generate_gemini_response(full_prompt_content, model, image_url, session=session)
     pass
 
-async def generate_gemini_response(prompt: str, model, image_url: str = None) -> str:
+async def fetch_image(image_url: str, session: Optional[aiohttp.ClientSession] = None) -> bytes:
+    """Downloads an image, reusing the bot's shared HTTP session when available."""
+    if session is None:
+        async with aiohttp.ClientSession() as temp_session:
+            return await fetch_image(image_url, temp_session)
+    async with session.get(image_url) as image_response:
+        image_response.raise_for_status()
+        return await image_response.read()
+
+async def generate_gemini_response(prompt: str, model, image_url: str = None, session: Optional[aiohttp.ClientSession] = None) -> str:
     """Generates response from Gemini API."""
     logger.info("Entering generate_gemini_response function")
     logger.info(f"Prompt to Gemini: {prompt}, Image URL: {image_url}")
@@ -197,9 +220,7 @@ async def generate_gemini_response(prompt: str, model, image_url: str = None) ->
     if image_url:
         try:
             logger.info(f"Fetching image from URL: {image_url}")
-            image_response = requests.get(image_url, stream=True)
-            image_response.raise_for_status()
-            image_data = image_response.content
+            image_data = await fetch_image(image_url, session)
             kind = filetype.guess(image_data)
             if kind is None:
                 logger.warning("Could not determine image type. Defaulting to png.")
@@ -209,14 +230,16 @@ async def generate_gemini_response(prompt: str, model, image_url: str = None) ->
 
             content_parts.append({"inline_data": {"mime_type": mime_type, "data": base64.b64encode(image_data).decode()}})
             logger.info(f"Image fetched and added to content parts (type: {mime_type}).")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching image: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # The shared session's ClientTimeout raises asyncio.TimeoutError, not a ClientError
+            logger.error(f"Error fetching image: {e!r}")
             return "I couldn't download the image. Please check the link."
         except Exception as e:
             logger.exception(f"Unexpected error fetching/processing image: {e}")
             return "An unexpected error occurred while processing the image."
 
     try:
+        import google.generativeai as genai
         logger.info("Sending request to Gemini API...")
         response = model.generate_content(contents=content_parts, generation_config=genai.types.GenerationConfig(max_output_tokens=200))
         return response.text
@@ -228,8 +251,8 @@ async def generate_gemini_response(prompt: str, model, image_url: str = None) ->
 async def setup(bot: commands.Bot):
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     if not GEMINI_API_KEY:
-        print("GEMINI_API_KEY not found in environment variables. Gemini Cog will not be loaded.")
-        return  # Exit the setup function without loading the cog
+        # Raise so the extension loader reports the cog as not loaded
+        raise ValueError("GEMINI_API_KEY not found in environment variables. Gemini Cog will not be loaded.")
 
     try:
         # Only initialize and add the cog if the API key is present
@@ -238,7 +261,7 @@ async def setup(bot: commands.Bot):
     except ValueError as e:
         print(f"Gemini Cog could not be loaded: {e}") # Catch the ValueError from GeminiCog init if it still occurs after checking above
         print("Please ensure GEMINI_API_KEY is set correctly in your environment variables.")
-        return # Exit setup if there's a ValueError during cog initialization
+        raise
     except Exception as e:
         print(f"An unexpected error occurred during Gemini Cog setup: {e}")
-        return # Exit setup if any other error occurs
\ No newline at end of file
+        raise
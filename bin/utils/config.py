@@ -1,26 +1,35 @@
-import json
+import asyncio
+import orjson
 import os
 import logging
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger('discord_bot.config')
 
+# Non-string keys (e.g. int guild IDs) are written as strings, as json.dump did
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 class BotConfig:
     """Centralized configuration management for the Discord bot."""
     
-    def __init__(self, config_file: str = "bot_config.json"):
+    def __init__(self, config_file: str = "bot_config.json", save_delay: float = 2.0):
         self.config_file = config_file
         self.config: Dict[str, Any] = {}
+        self.save_delay = save_delay  # Seconds to coalesce writes over
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_task: Optional[asyncio.Task] = None  # In-flight threaded write
+        self._write_lock: Optional[asyncio.Lock] = None  # Created on first use, inside the loop
         self.load_config()
     
     def load_config(self) -> None:
         """Load configuration from file."""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, "r") as f:
+                with open(self.config_file, "rb") as f:
                     content = f.read().strip()
                     if content:
-                        self.config = json.loads(content)
+                        self.config = orjson.loads(content)
                     else:
                         self.config = self._create_default_config()
             else:
@@ -32,13 +41,97 @@ class BotConfig:
             self.config = self._create_default_config()
     
     def save_config(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file immediately.
+        
+        Blocks the caller; only for use outside the event loop. Async code should
+        await ``flush()`` so the write is ordered after any in-flight one.
+        """
+        self._cancel_scheduled_flush()
+        try:
+            self._write_config(orjson.dumps(self.config, option=_DUMP_OPTIONS))
+            self._dirty = False
+        except Exception as e:
+            # Leave the config dirty so the next flush retries instead of dropping the change
+            logger.error(f"Error saving configuration: {e}")
+    
+    async def save_config_async(self) -> None:
+        """Save configuration to file without blocking the event loop."""
+        self._cancel_scheduled_flush()
+        # One writer at a time: every write goes through the same temp file
+        async with self._get_write_lock():
+            await self._wait_for_write()
+            try:
+                # Serialize on the loop so the dict can't change mid-dump; only the disk I/O moves off it
+                data = orjson.dumps(self.config, option=_DUMP_OPTIONS)
+            except Exception as e:
+                logger.error(f"Error saving configuration: {e}")
+                return
+            # Clear before the await so changes made during the write mark the config dirty again
+            self._dirty = False
+            self._write_task = asyncio.create_task(self._write_in_thread(data))
+            # Shielded so a cancelled caller can't abandon the thread mid-write
+            await asyncio.shield(self._write_task)
+    
+    async def flush(self) -> None:
+        """Write any pending changes to disk, after any write already in progress."""
+        if self._dirty:
+            await self.save_config_async()
+        else:
+            self._cancel_scheduled_flush()
+            await self._wait_for_write()
+    
+    def _get_write_lock(self) -> asyncio.Lock:
+        """Return the write lock, creating it on the running loop (3.9 binds locks at creation)."""
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        return self._write_lock
+    
+    async def _write_in_thread(self, data: bytes) -> None:
+        """Write serialized config in a worker thread, keeping it dirty if the write fails."""
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=4)
+            await asyncio.to_thread(self._write_config, data)
         except Exception as e:
+            # Keep the change pending so the next flush retries it
+            self._dirty = True
             logger.error(f"Error saving configuration: {e}")
     
+    async def _wait_for_write(self) -> None:
+        """Wait for an in-flight threaded write to finish, if there is one."""
+        if self._write_task is not None and not self._write_task.done():
+            await asyncio.wait({self._write_task})
+    
+    def _write_config(self, data: bytes) -> None:
+        """Atomically replace the config file so a crash mid-write never truncates it."""
+        tmp_file = f"{self.config_file}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, self.config_file)
+    
+    def _schedule_save(self) -> None:
+        """Mark the config dirty and coalesce bursts of changes into one write."""
+        self._dirty = True
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. startup scripts), so write straight away
+            self.save_config()
+            return
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def _flush_later(self) -> None:
+        """Wait for changes to settle, then write them off the event loop."""
+        await asyncio.sleep(self.save_delay)
+        self._flush_task = None
+        if self._dirty:
+            await self.save_config_async()
+    
+    def _cancel_scheduled_flush(self) -> None:
+        """Cancel a pending debounced write, if any."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+    
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         if section in self.config and key in self.config[section]:
@@ -54,7 +147,7 @@ class BotConfig:
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = value
-        self.save_config()
+        self._schedule_save()
     
     def get_guild_config(self, guild_id: str) -> Dict[str, Any]:
         """Get guild-specific configuration."""
@@ -67,7 +160,7 @@ class BotConfig:
         if guild_id not in self.config["guilds"]:
             self.config["guilds"][guild_id] = {}
         self.config["guilds"][guild_id][key] = value
-        self.save_config()
+        self._schedule_save()
     
     def _create_default_config(self) -> Dict[str, Any]:
         """Create default configuration."""
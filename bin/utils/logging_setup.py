@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 def setup_logging():
     """Configure logging for the entire application."""
@@ -23,7 +25,6 @@ def setup_logging():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
     
     # File handler - for info and above
     file_handler = RotatingFileHandler(
@@ -33,7 +34,6 @@ def setup_logging():
     )
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # Error file handler - for errors only
     error_handler = RotatingFileHandler(
@@ -43,15 +43,28 @@ def setup_logging():
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(formatter)
-    logger.addHandler(error_handler)
+    
+    # Hand records to a background thread so console/file I/O never blocks the event loop
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    
+    listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
     # Configure discord.py's logger
     discord_logger = logging.getLogger('discord')
     discord_logger.setLevel(logging.WARNING)  # Only warnings and errors
     
-    # Add the handlers to discord.py's logger too
-    for handler in logger.handlers:
-        discord_logger.addHandler(handler)
+    # Route discord.py's records through the same queue
+    discord_logger.addHandler(queue_handler)
     
     logger.info("Logging system initialized")
     return logger
\ No newline at end of file
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import orjson
+
+from bin.utils.config import BotConfig
+
+
+class SlowConfig(BotConfig):
+    """BotConfig whose disk writes take long enough for saves to overlap."""
+
+    def _write_config(self, data: bytes) -> None:
+        time.sleep(0.05)
+        super()._write_config(data)
+
+
+def read_config(path):
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def test_concurrent_saves_do_not_collide(tmp_path, caplog):
+    path = tmp_path / "cfg.json"
+    config = SlowConfig(str(path), save_delay=0.01)
+
+    async def run():
+        for i in range(5):
+            config.config["general"]["counter"] = i
+            config._dirty = True
+        await asyncio.gather(*(config.save_config_async() for _ in range(5)))
+
+    asyncio.run(run())
+    assert "Error saving configuration" not in caplog.text
+    assert read_config(path)["general"]["counter"] == 4
+    assert not (tmp_path / "cfg.json.tmp").exists()
+
+
+def test_flush_writes_after_in_flight_save(tmp_path):
+    path = tmp_path / "cfg.json"
+    config = SlowConfig(str(path), save_delay=0.01)
+
+    async def run():
+        config.set("general", "value", "old")
+        # Let the debounced save start its threaded write
+        await asyncio.sleep(0.03)
+        config.set("general", "value", "new")
+        await config.flush()
+
+    asyncio.run(run())
+    assert read_config(path)["general"]["value"] == "new"
+    assert not config._dirty
+
+
+def test_failed_save_stays_dirty(tmp_path):
+    config = BotConfig(str(tmp_path / "cfg.json"))
+    config.config_file = str(tmp_path / "missing" / "cfg.json")
+
+    async def run():
+        config.set("general", "value", 1)
+        await config.flush()
+
+    asyncio.run(run())
+    assert config._dirty
@@ -1,152 +1,294 @@
+import aiohttp
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 import os
 import asyncio
+import hashlib
+import json
 import sys
-import traceback
-from typing import Optional, Type, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Optional
 
 # UTILITY IMPORTS
 from bin.utils.config import BotConfig
 from bin.utils.logging_setup import setup_logging
 
+@dataclass(frozen=True)
+class Env:
+    """Environment variables the bot depends on, read once at startup."""
+    token: str
+    application_id: int
+    owner_id: int
+    gemini_key: Optional[str]
+
 # Load environment variables
 load_dotenv()
-TOKEN = os.getenv("DISCORD_TOKEN")
-APPLICATION_ID = os.getenv("APPLICATION_ID")
-OWNER_ID = os.getenv("OWNER_ID")
-if not TOKEN:
-    print("ERROR: DISCORD_TOKEN environment variable not set!")
-    sys.exit(1)
-if not OWNER_ID:
-    print("ERROR: OWNER_ID environment variable not set!")
+_REQUIRED_ENV = ("DISCORD_TOKEN", "APPLICATION_ID", "OWNER_ID")
+try:
+    _token, _application_id, _owner_id = itemgetter(*_REQUIRED_ENV)(os.environ)
+    # Empty values count as missing, matching the original `if not X` checks
+    for _name, _value in zip(_REQUIRED_ENV, (_token, _application_id, _owner_id)):
+        if not _value.strip():
+            raise KeyError(_name)
+except KeyError as e:
+    print(f"ERROR: {e.args[0]} environment variable not set!")
     sys.exit(1)
 
+def _int_env(name: str, value: str) -> int:
+    """Convert a numeric ID variable, exiting with a readable error if it isn't one."""
+    try:
+        return int(value)
+    except ValueError:
+        print(f"ERROR: {name} environment variable is not a valid ID!")
+        sys.exit(1)
+
+ENV = Env(
+    token=_token,
+    application_id=_int_env("APPLICATION_ID", _application_id),
+    owner_id=_int_env("OWNER_ID", _owner_id),
+    gemini_key=os.environ.get("GEMINI_API_KEY"),
+)
+
+# Cog extensions loaded on every start; names in general.disabled_extensions are skipped
+EXTENSIONS = (
+    "bin.cogs.moderation.welcome_cog",
+    "bin.cogs.utility.misc_commands_cog",
+)
+# Loaded only when GEMINI_API_KEY is set
+GEMINI_EXTENSION = "bin.services.gemini_cog"
+
+# Hash of the last successfully synced command tree
+COMMAND_TREE_HASH_FILE = os.path.join(".cache", "command_tree.hash")
+
+# In-flight tree sync shared by overlapping on_ready events
+_sync_task: Optional[asyncio.Task] = None
+
 # Initialize configuration and logging
 config = BotConfig()
 logger = setup_logging()
 
+# Presence shown on every ready/resume, built once from config
+ACTIVITY = discord.Activity(
+    type=discord.ActivityType.watching, 
+    name=config.get("general", "status_message", "over your server!")
+)
+
 # Setting Discord Intents
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 intents.voice_states = True
 
+class AetherBot(commands.Bot):
+    """Bot that loads its cogs in the background while it logs in."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cogs_loaded: Optional[asyncio.Task] = None
+    
+    async def setup_hook(self):
+        """Start cog loading so it overlaps with the gateway connection."""
+        self.cogs_loaded = asyncio.create_task(setup_cogs())
+
 # Bot Initialization
-bot = commands.Bot(command_prefix="!", intents=intents)
-bot.owner_id = int(OWNER_ID)
+bot = AetherBot(command_prefix="!", intents=intents, application_id=ENV.application_id)
+bot.owner_id = ENV.owner_id
 
-@bot.event
 async def on_ready():
     """Handles the bot's ready event."""
-    logger.info(f"{bot.user} is online!")
+    # Don't expose or sync a half-loaded command tree
+    if bot.cogs_loaded is not None:
+        await bot.cogs_loaded
+    logger.info("%s is online!", bot.user)
     
     # Set bot status
-    activity = discord.Activity(
-        type=discord.ActivityType.watching, 
-        name=config.get("general", "status_message", "over your server!")
-    )
-    await bot.change_presence(activity=activity)
+    await bot.change_presence(activity=ACTIVITY)
     
-    # Sync commands
+    # Sync commands, skipping the global PUT when nothing changed since the last sync
     try:
+        tree_hash = command_tree_hash()
+        if tree_hash == read_cached_tree_hash():
+            logger.info("Command tree unchanged since last sync, skipping sync")
+            return
+        
         logger.info("Syncing application commands...")
-        synced = await bot.tree.sync()
-        logger.info(f"Synced {len(synced)} command(s) globally")
-        for command in synced:
-            logger.info(f"  - {command.name}")
+        synced = await sync_command_tree()
+        logger.info(
+            "Synced %d command(s) globally: %s",
+            len(synced),
+            ", ".join(command.name for command in synced)
+        )
+        write_cached_tree_hash(tree_hash)
     except Exception as e:
-        logger.error(f"Error syncing commands: {e}")
+        logger.error("Error syncing commands: %s", e)
+
+async def sync_command_tree():
+    """Sync the global command tree, joining an in-flight sync instead of starting another."""
+    global _sync_task
+    if _sync_task is None or _sync_task.done():
+        _sync_task = asyncio.create_task(bot.tree.sync())
+    # Shield so one cancelled waiter doesn't abort the sync for the others
+    return await asyncio.shield(_sync_task)
+
+def command_tree_hash() -> str:
+    """Hash the serialized global command tree together with the application it belongs to."""
+    payload = {
+        "application_id": bot.application_id,
+        "commands": [command.to_dict(bot.tree) for command in bot.tree.get_commands()],
+    }
+    serialized = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+def read_cached_tree_hash() -> Optional[str]:
+    """Return the hash stored after the last successful sync, if any."""
+    try:
+        with open(COMMAND_TREE_HASH_FILE, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def write_cached_tree_hash(tree_hash: str) -> None:
+    """Remember the hash of a tree that was synced successfully."""
+    try:
+        os.makedirs(os.path.dirname(COMMAND_TREE_HASH_FILE), exist_ok=True)
+        with open(COMMAND_TREE_HASH_FILE, "w") as f:
+            f.write(tree_hash)
+    except OSError as e:
+        # A stale or missing hash only means the next start syncs again
+        logger.warning("Could not save command tree hash: %s", e)
+
+async def _ignore_error(ctx, error):
+    """Drop errors that need no reply."""
+
+async def _missing_argument(ctx, error):
+    await ctx.send(f"Missing required argument: {error.param.name}")
+
+async def _bad_argument(ctx, error):
+    await ctx.send(f"Bad argument: {error}")
+
+async def _unhandled_error(ctx, error):
+    await ctx.send(f"An error occurred: {error}")
+
+# Error type -> reply handler; subclasses are added on first sight
+COMMAND_ERROR_HANDLERS = {
+    commands.CommandNotFound: _ignore_error,
+    commands.MissingRequiredArgument: _missing_argument,
+    commands.BadArgument: _bad_argument,
+}
+
+def get_error_handler(error_type: type):
+    """Look up the handler for an error type, resolving and caching subclasses via the MRO."""
+    handler = COMMAND_ERROR_HANDLERS.get(error_type)
+    if handler is None:
+        handler = next(
+            (COMMAND_ERROR_HANDLERS[cls] for cls in error_type.__mro__ if cls in COMMAND_ERROR_HANDLERS),
+            _unhandled_error
+        )
+        COMMAND_ERROR_HANDLERS[error_type] = handler
+    return handler
 
-@bot.event
 async def on_command_error(ctx, error):
     """Global error handler for traditional commands."""
-    logger.error(f"Command error in {ctx.command}: {error}")
-    
-    if isinstance(error, commands.CommandNotFound):
-        return
-    elif isinstance(error, commands.MissingRequiredArgument):
-        await ctx.send(f"Missing required argument: {error.param.name}")
-    elif isinstance(error, commands.BadArgument):
-        await ctx.send(f"Bad argument: {error}")
-    else:
-        await ctx.send(f"An error occurred: {error}")
+    logger.error("Command error in %s: %s", ctx.command, error)
+    await get_error_handler(type(error))(ctx, error)
 
-async def load_cog(
-    bot: commands.Bot, 
-    cog_class: Type[commands.Cog], 
-    *args: Any
-) -> Optional[commands.Cog]:
+# Register event handlers as plain listeners
+bot.add_listener(on_ready, "on_ready")
+bot.add_listener(on_command_error, "on_command_error")
+
+async def load_extension(bot: commands.Bot, name: str) -> bool:
     """
-    Load a cog with dependency injection.
+    Load a cog extension by module path.
     
     Args:
         bot: The bot instance
-        cog_class: The cog class to instantiate
-        *args: Arguments to pass to the cog constructor
+        name: Dotted module path of an extension exposing ``async def setup(bot)``
     
     Returns:
-        The loaded cog instance or None if loading failed
+        True if the extension loaded, False otherwise
     """
     try:
-        cog_instance = cog_class(bot, *args)
-        await bot.add_cog(cog_instance)
-        logger.info(f"Loaded {cog_class.__name__}")
-        return cog_instance
+        await bot.load_extension(name)
+        logger.info("Loaded %s", name)
+        return True
     except Exception as e:
-        logger.error(f"Error loading {cog_class.__name__}: {e}")
-        logger.debug(traceback.format_exc())
-        return None
+        logger.exception("Error loading %s: %s", name, e)
+        return False
 
 async def setup_cogs():
-    """Load all cogs with proper dependency injection."""
+    """Load all cog extensions."""
     logger.info("Setting up cogs...")
     
-    # Utility and moderation cogs
-    try:
-        from bin.cogs.moderation.welcome_cog import Welcome
-        from bin.cogs.utility.misc_commands_cog import ServerCog
-        
-        await load_cog(bot, Welcome)
-        await load_cog(bot, ServerCog)
-        
-        logger.info("Utility and moderation cogs loaded successfully")
-    except Exception as e:
-        logger.error(f"Failed to set up utility cogs: {e}")
-        logger.debug(traceback.format_exc())
+    # Shared services are exposed on the bot so extension setup functions can reach them
+    bot.app_config = config
     
-    # Optional integrations
-    if os.getenv("GEMINI_API_KEY"):
-        try:
-            from bin.services.gemini_cog import GeminiCog
-            await load_cog(bot, GeminiCog)
-            logger.info("Gemini integration loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to set up Gemini integration: {e}")
-            logger.debug(traceback.format_exc())
+    disabled = set(config.get("general", "disabled_extensions", []))
+    extensions = [name for name in EXTENSIONS if name not in disabled]
+    for name in disabled:
+        logger.info("Skipping disabled extension %s", name)
+    
+    # The core cogs are independent, so load them concurrently
+    results = await asyncio.gather(*(load_extension(bot, name) for name in extensions))
+    failed = [name for name, loaded in zip(extensions, results) if not loaded]
+    if failed:
+        logger.error("Failed to load cogs: %s", ", ".join(failed))
     else:
+        logger.info("Core cogs loaded successfully")
+    
+    # Optional integrations
+    if not ENV.gemini_key:
         logger.warning("GEMINI_API_KEY not found. Gemini features will not be available.")
+    elif GEMINI_EXTENSION not in disabled:
+        if await load_extension(bot, GEMINI_EXTENSION):
+            logger.info("Gemini integration loaded successfully")
 
 async def main():
     """Main entry point for the bot."""
+    # Blocking work (cog construction, config and link writes) shares one small thread pool
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=4))
+    
     try:
-        # Setup cogs
-        await setup_cogs()
-        
-        # Start the bot
-        logger.info("Starting bot...")
-        await bot.start(TOKEN)
+        # One HTTP connection pool shared by every cog that makes outbound requests
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as session:
+            bot.http_session = session
+            
+            # Start the bot; cogs load from setup_hook while it connects
+            logger.info("Starting bot...")
+            await bot.start(ENV.token)
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
     except Exception as e:
-        logger.critical(f"Fatal error: {e}")
-        logger.debug(traceback.format_exc())
+        logger.critical("Fatal error: %s", e, exc_info=True)
     finally:
-        # Clean shutdown
-        if not bot.is_closed():
+        # Clean shutdown; close() is idempotent, so no is_closed() pre-check is needed
+        try:
             await bot.close()
+        except Exception as e:
+            logger.error("Error while closing the bot: %s", e)
+        await config.flush()
         logger.info("Bot has been shut down")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop has lower per-callback overhead than the stock selector loop; it isn't available on Windows
+    loop_factory = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            pass
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(debug=False, loop_factory=loop_factory) as runner:
+            runner.run(main())
+    else:
+        # asyncio.Runner needs 3.11+; older interpreters select the loop through the policy
+        if loop_factory is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main())
\ No newline at end of file